@@ -0,0 +1,250 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled scanning loop for CSVParser
+Build with `python setup.py build_ext --inplace`; optional at runtime
+"""
+
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from cpython.unicode cimport PyUnicode_DecodeASCII
+
+
+cdef inline str _ascii(const unsigned char* p, Py_ssize_t start,
+                       Py_ssize_t end):
+    return PyUnicode_DecodeASCII(<const char*>p + start, end - start, NULL)
+
+
+cdef inline bint _is_space(unsigned char c):
+    # Same ASCII set as str.strip()
+    return c == 32 or 9 <= c <= 13 or 28 <= c <= 31
+
+
+cdef inline bint _is_digit(unsigned char c):
+    return 48 <= c <= 57
+
+
+cdef inline bint _is_alnum(unsigned char c):
+    return 48 <= c <= 57 or 65 <= c <= 90 or 97 <= c <= 122
+
+
+cdef int _read_number(const unsigned char* p, Py_ssize_t* pos, Py_ssize_t end,
+                      int min_len, int max_len):
+    """Read min_len..max_len digits at pos[0]; -1 if there are not enough"""
+    cdef int value = 0
+    cdef int count = 0
+    while pos[0] < end and count < max_len and _is_digit(p[pos[0]]):
+        value = value * 10 + (p[pos[0]] - 48)
+        pos[0] += 1
+        count += 1
+    if count < min_len:
+        return -1
+    return value
+
+
+cdef long long _mdy_key(const unsigned char* p, Py_ssize_t start,
+                        Py_ssize_t end):
+    """
+    Parse a stripped '%m/%d/%Y %H:%M' field into YYYYMMDDHHMM
+
+    Mirrors validator.parse_mdy_datetime; returns -1 if invalid.
+    """
+    cdef Py_ssize_t pos = start
+    cdef int month, day, year, hour, minute, max_day
+
+    month = _read_number(p, &pos, end, 1, 2)
+    if month < 0 or pos >= end or p[pos] != 47:  # '/'
+        return -1
+    pos += 1
+    day = _read_number(p, &pos, end, 1, 2)
+    if day < 0 or pos >= end or p[pos] != 47:
+        return -1
+    pos += 1
+    year = _read_number(p, &pos, end, 4, 4)
+    if year < 0 or pos >= end or not _is_space(p[pos]):
+        return -1
+    while pos < end and _is_space(p[pos]):
+        pos += 1
+    hour = _read_number(p, &pos, end, 1, 2)
+    if hour < 0 or pos >= end or p[pos] != 58:  # ':'
+        return -1
+    pos += 1
+    minute = _read_number(p, &pos, end, 1, 2)
+    if minute < 0 or pos != end:
+        return -1
+
+    if year < 1 or month < 1 or month > 12 or hour > 23 or minute > 59 \
+            or day < 1:
+        return -1
+    if month == 2:
+        if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+            max_day = 29
+        else:
+            max_day = 28
+    elif month == 4 or month == 6 or month == 9 or month == 11:
+        max_day = 30
+    else:
+        max_day = 31
+    if day > max_day:
+        return -1
+
+    return ((((<long long>year * 100 + month) * 100 + day) * 100 + hour)
+            * 100 + minute)
+
+
+def scan_rows(const unsigned char[:] data, Py_ssize_t start, Py_ssize_t width,
+              tuple positions, airports):
+    """
+    Scan the data lines of an ASCII CSV file without quotes
+
+    Rows that pass every validation rule are collected column by column.
+    Every other non-empty row (comments, short rows, invalid values) is
+    returned untouched so the Python parser can handle it.
+
+    Args:
+        data (buffer): Whole file, e.g. a read-only mmap; lines end with
+            '\\n' or '\\r\\n'
+        start (int): Offset of the first data line (after the header)
+        width (int): Number of header columns
+        positions (tuple): Column index of each FLIGHT_FIELDS entry;
+            width marks a column missing from the header
+        airports (frozenset): Packed codes of the valid airports
+
+    Returns:
+        tuple or None: (columns, valid_lines, pending), or None if a data
+            line holds a quote, NUL, non-ASCII byte or bare '\\r'
+            - columns (tuple): flight_id, origin, destination,
+              departure_datetime, arrival_datetime and price lists
+            - valid_lines (list): Line number of each valid row
+            - pending (list): (line_number, raw line) for other rows
+    """
+    cdef Py_ssize_t n = data.shape[0]
+    cdef const unsigned char* p
+    cdef Py_ssize_t line_start = start, line_end, next_start
+    cdef Py_ssize_t pos, field, slot, s, e
+    cdef unsigned char c = 0
+    cdef Py_ssize_t line_num = 1
+    cdef Py_ssize_t[6] want
+    cdef Py_ssize_t[6] starts
+    cdef Py_ssize_t[6] ends
+    cdef Py_ssize_t max_want = 0
+    cdef long long dep_key, arr_key
+    cdef int found
+    cdef Py_ssize_t k
+    cdef bint ok
+
+    for slot in range(6):
+        want[slot] = positions[slot]
+        if want[slot] > max_want:
+            max_want = want[slot]
+
+    flight_ids, origins, destinations = [], [], []
+    departures, arrivals, prices = [], [], []
+    valid_lines = []
+    pending = []
+
+    if start >= n:
+        return (flight_ids, origins, destinations, departures, arrivals,
+                prices), valid_lines, pending
+    p = &data[0]
+
+    while line_start < n:
+        # Find the end of the line, stopping early at any byte this
+        # scanner leaves to the Python parser
+        line_end = line_start
+        while line_end < n:
+            c = p[line_end]
+            if c == 10 or c == 13 or c == 34 or c == 0 or c >= 128:
+                break
+            line_end += 1
+        if line_end == n:
+            next_start = n
+        elif c == 10:  # '\n'
+            next_start = line_end + 1
+        elif c == 13 and line_end + 1 < n and p[line_end + 1] == 10:
+            next_start = line_end + 2  # '\r\n'
+        else:
+            return None
+        line_num += 1
+
+        if line_end > line_start:
+            # Locate the wanted fields
+            found = 0
+            field = 0
+            s = line_start
+            pos = line_start
+            while True:
+                if pos == line_end or p[pos] == 44:  # ',' or end of line
+                    for slot in range(6):
+                        if want[slot] == field:
+                            starts[slot] = s
+                            ends[slot] = pos
+                            found += 1
+                    if pos == line_end:
+                        break
+                    field += 1
+                    s = pos + 1
+                pos += 1
+
+            ok = max_want < width and found == 6
+
+            # Strip each field; a leading '#' marks a comment line
+            if ok:
+                s = line_start
+                while s < line_end and _is_space(p[s]):
+                    s += 1
+                ok = s == line_end or p[s] != 35  # '#'
+
+            if ok:
+                for slot in range(6):
+                    s = starts[slot]
+                    e = ends[slot]
+                    while s < e and _is_space(p[s]):
+                        s += 1
+                    while e > s and _is_space(p[e - 1]):
+                        e -= 1
+                    starts[slot] = s
+                    ends[slot] = e
+
+                # flight_id: 2-8 alphanumeric characters
+                e = ends[0] - starts[0]
+                ok = 2 <= e <= 8
+                k = starts[0]
+                while ok and k < ends[0]:
+                    ok = _is_alnum(p[k])
+                    k += 1
+
+            # origin/destination: known 3-letter airport codes
+            for slot in range(1, 3):
+                if ok:
+                    s = starts[slot]
+                    ok = (ends[slot] - s == 3 and
+                          ((p[s] << 16) | (p[s + 1] << 8) | p[s + 2]) in airports)
+
+            if ok:
+                dep_key = _mdy_key(p, starts[3], ends[3])
+                arr_key = _mdy_key(p, starts[4], ends[4])
+                ok = dep_key >= 0 and arr_key > dep_key
+
+            if ok:
+                try:
+                    price = float(PyBytes_FromStringAndSize(
+                        <const char*>p + starts[5], ends[5] - starts[5]))
+                except ValueError:
+                    ok = False
+                else:
+                    ok = not price <= 0
+
+            if ok:
+                flight_ids.append(_ascii(p, starts[0], ends[0]))
+                origins.append(_ascii(p, starts[1], ends[1]))
+                destinations.append(_ascii(p, starts[2], ends[2]))
+                departures.append(_ascii(p, starts[3], ends[3]))
+                arrivals.append(_ascii(p, starts[4], ends[4]))
+                prices.append(price)
+                valid_lines.append(line_num)
+            else:
+                pending.append((line_num, _ascii(p, line_start, line_end)))
+
+        line_start = next_start
+
+    columns = (flight_ids, origins, destinations, departures, arrivals, prices)
+    return columns, valid_lines, pending
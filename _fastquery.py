@@ -0,0 +1,27 @@
+"""
+Numba-compiled matcher for QueryEngine
+Imported on first use by engines created with compiled=True
+"""
+
+from numba import njit, prange
+
+
+# Sentinels: a missing departure never satisfies a lower bound and a
+# missing arrival never satisfies an upper bound
+NO_DEPARTURE = -(2 ** 63)
+NO_ARRIVAL = 2 ** 63 - 1
+
+
+@njit(parallel=True, cache=True)
+def match_flights(dep_ts, arr_ts, price, price_ok, fid, org, dst,
+                  q_fid, q_org, q_dst, q_dep, q_arr, q_price, use_price, out):
+    """Fill out[i] with whether flight i matches the encoded query"""
+    for i in prange(dep_ts.shape[0]):
+        out[i] = (
+            (q_fid < 0 or fid[i] == q_fid)
+            and (q_org < 0 or org[i] == q_org)
+            and (q_dst < 0 or dst[i] == q_dst)
+            and dep_ts[i] >= q_dep
+            and arr_ts[i] <= q_arr
+            and (not use_price or (price_ok[i] and not price[i] > q_price))
+        )
@@ -12,10 +12,11 @@ from pathlib import Path #object-oriented way to handle file paths
 from datetime import datetime #handles dates and times 
 from validator import FlightValidator #Imports the FlightValidator class from validator.py
 
+from flight_table import FlightTable #Column-oriented store for parsed flights
 from parser import CSVParser, JSONParser #CSVParser → reads and parses flight data from CSV files
  #JSONParser → reads and parses flight data from JSON files.
 from query_engine import QueryEngine #Imports QueryEngine from query_engine.py
-from utils import save_json, save_errors #from utils import save_json, save_errors
+from utils import save_json, save_json_stream, save_errors, iter_in_background #JSON/error-file writers from utils.py
 
 
 def parse_arguments():
@@ -44,6 +45,10 @@ Examples:
                        type=str,
                        default='db.json')
     
+    parser.add_argument('--pretty',
+                       help='Indent the valid flights JSON for human readers (default: compact)',
+                       action='store_true')
+    
     parser.add_argument('-j', '--json',
                        help='Load existing JSON database instead of parsing CSVs',
                        type=str)
@@ -63,6 +68,7 @@ def main():
     validator = FlightValidator()
     valid_flights = []
     errors = []
+    query_engine = None
     
     # Step 1: Load or parse data
     if args.json:
@@ -70,8 +76,15 @@ def main():
         print(f"Loading existing database from: {args.json}")
         try:
             json_parser = JSONParser()
-            valid_flights = json_parser.load(args.json)
-            print(f"✓ Loaded {len(valid_flights)} flights from database")
+            flights = json_parser.iter_load(args.json)
+            if args.query:
+                # Stream records straight into the query engine's columns
+                query_engine = QueryEngine(flights)
+                valid_flights = query_engine.flights
+                flight_count = len(valid_flights)
+            else:
+                flight_count = sum(1 for _ in flights)
+            print(f"✓ Loaded {flight_count} flights from database")
         except Exception as e:
             print(f"✗ Error loading JSON: {e}")
             sys.exit(1)
@@ -80,11 +93,11 @@ def main():
         # Parse single CSV file
         print(f"Parsing CSV file: {args.input}")
         csv_parser = CSVParser(validator)
-        valid_flights, errors = csv_parser.parse_file(args.input)
+        valid_flights, errors = csv_parser.parse_file_vectorized(args.input)
         print(f"✓ Parsed {len(valid_flights)} valid flights, {len(errors)} errors")
         
         # Save results
-        save_json(valid_flights, args.output)
+        save_json(valid_flights, args.output, pretty=args.pretty)
         if errors:
             save_errors(errors, 'errors.txt')
             print(f"✓ Errors saved to: errors.txt")
@@ -93,11 +106,26 @@ def main():
         # Parse all CSV files in directory
         print(f"Parsing all CSV files in directory: {args.directory}")
         csv_parser = CSVParser(validator)
-        valid_flights, errors = csv_parser.parse_directory(args.directory)
-        print(f"✓ Parsed {len(valid_flights)} valid flights, {len(errors)} errors")
+        valid_flights = FlightTable()
+        flight_count = 0
+        file_results = iter_in_background(
+            csv_parser.iter_directory(args.directory))
+        
+        def valid_chunks():
+            """Collect errors while passing each file's flights to the writer"""
+            nonlocal flight_count
+            for file_flights, file_errors in file_results:
+                flight_count += len(file_flights)
+                errors.extend(file_errors)
+                # Only keep every flight in memory when it will be queried
+                if args.query:
+                    valid_flights.extend(file_flights)
+                yield file_flights
+        
+        # Parse and save concurrently: each file is written as it arrives
+        save_json_stream(valid_chunks(), args.output, pretty=args.pretty)
+        print(f"✓ Parsed {flight_count} valid flights, {len(errors)} errors")
         
-        # Save results
-        save_json(valid_flights, args.output)
         if errors:
             save_errors(errors, 'errors.txt')
             print(f"✓ Errors saved to: errors.txt")
@@ -115,7 +143,8 @@ def main():
         
         print(f"\nExecuting queries from: {args.query}")
         try:
-            query_engine = QueryEngine(valid_flights)
+            if query_engine is None:
+                query_engine = QueryEngine(valid_flights)
             results = query_engine.execute_queries_from_file(args.query)
             
             # Generate response filename with timestamp
@@ -126,7 +155,7 @@ def main():
             lastname = "Dilshan"
             response_file = f"response_{student_id}_{name}_{lastname}_{timestamp}.json"
             
-            save_json(results, response_file)
+            save_json(results, response_file, pretty=True)
             print(f"✓ Query results saved to: {response_file}")
             print(f"  Executed {len(results)} queries")
             for i, result in enumerate(results, 1):
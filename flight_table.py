@@ -0,0 +1,106 @@
+"""
+Column-oriented flight storage
+Keeps parsed flights as one list/array per field instead of one dict per flight
+"""
+
+from array import array
+
+
+# Columns every flight record is built from, in output order
+FLIGHT_FIELDS = ('flight_id', 'origin', 'destination',
+                 'departure_datetime', 'arrival_datetime', 'price')
+
+
+class FlightTable:
+    """Struct-of-arrays store for validated flights"""
+    
+    def __init__(self):
+        """Initialize an empty table"""
+        self.flight_id = []
+        self.origin = []
+        self.destination = []
+        self.departure_datetime = []
+        self.arrival_datetime = []
+        self.price = array('d')
+    
+    @classmethod
+    def from_columns(cls, flight_id, origin, destination,
+                     departure_datetime, arrival_datetime, price):
+        """
+        Build a table from whole columns
+        
+        Args:
+            flight_id, origin, destination (iterable): String columns
+            departure_datetime, arrival_datetime (iterable): Datetime strings
+            price (iterable): Float prices
+        
+        Returns:
+            FlightTable: Table holding the given columns
+        """
+        table = cls()
+        table.flight_id = list(flight_id)
+        table.origin = list(origin)
+        table.destination = list(destination)
+        table.departure_datetime = list(departure_datetime)
+        table.arrival_datetime = list(arrival_datetime)
+        table.price = array('d', price)
+        return table
+    
+    def column(self, field):
+        """
+        Get the storage for one field
+        
+        Args:
+            field (str): One of FLIGHT_FIELDS
+        
+        Returns:
+            list or array: Column values, one per flight
+        """
+        return getattr(self, field)
+    
+    def append(self, flight):
+        """
+        Add one flight
+        
+        Args:
+            flight (dict): Typed flight dictionary with all FLIGHT_FIELDS
+        """
+        self.flight_id.append(flight['flight_id'])
+        self.origin.append(flight['origin'])
+        self.destination.append(flight['destination'])
+        self.departure_datetime.append(flight['departure_datetime'])
+        self.arrival_datetime.append(flight['arrival_datetime'])
+        self.price.append(flight['price'])
+    
+    def extend(self, other):
+        """
+        Append all flights of another table, column by column
+        
+        Args:
+            other (FlightTable): Table to copy flights from
+        """
+        for field in FLIGHT_FIELDS:
+            self.column(field).extend(other.column(field))
+    
+    def __len__(self):
+        return len(self.flight_id)
+    
+    def __getitem__(self, i):
+        """Rebuild flight i as a dictionary"""
+        return {field: self.column(field)[i] for field in FLIGHT_FIELDS}
+    
+    def __iter__(self):
+        """Rebuild each flight as a dictionary, in order"""
+        for values in zip(self.flight_id, self.origin, self.destination,
+                          self.departure_datetime, self.arrival_datetime,
+                          self.price):
+            yield dict(zip(FLIGHT_FIELDS, values))
+    
+    def to_dicts(self):
+        """
+        Rebuild all flights as dictionaries
+        
+        Returns:
+            list: List of flight dictionaries
+        """
+        return list(self)
@@ -5,8 +5,273 @@ Handles reading and parsing of flight data files
 
 import csv
 import json
+import mmap
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 
+from flight_table import FLIGHT_FIELDS, FlightTable
+from utils import load_json
+from validator import (FlightValidator, VALID_AIRPORTS,
+                       VALID_AIRPORTS_PACKED, pack_airport_code)
+
+@lru_cache(maxsize=None)
+def _load_fastparse():
+    """
+    Import the optional compiled scanner, if it has been built
+    
+    Build it with `python setup.py build_ext --inplace`.
+    
+    Returns:
+        module or None: The _fastparse extension, or None if not built
+    """
+    try:
+        import _fastparse
+    except ImportError:  # not built; the Python parsers are used instead
+        return None
+    return _fastparse
+
+
+@lru_cache(maxsize=None)
+def _load_pandas():
+    """
+    Import pandas on first use, so callers that never need it skip its cost
+    
+    Returns:
+        module or None: pandas, or None if it is not installed
+    """
+    try:
+        import pandas
+    except ImportError:  # pandas is optional; fall back to row-by-row parsing
+        return None
+    return pandas
+
+
+@lru_cache(maxsize=None)
+def _load_pyarrow():
+    """
+    Import pyarrow's CSV reader and compute functions on first use
+    
+    Returns:
+        tuple or None: (pyarrow, pyarrow.compute, pyarrow.csv), or None if
+            pyarrow is not installed
+    """
+    try:
+        import pyarrow
+        from pyarrow import compute, csv as pyarrow_csv
+    except ImportError:  # pyarrow is optional; pandas' C reader is used instead
+        return None
+    return pyarrow, compute, pyarrow_csv
+
+
+@lru_cache(maxsize=None)
+def _load_ijson():
+    """
+    Import ijson on first use
+    
+    Returns:
+        module or None: ijson, or None if it is not installed
+    """
+    try:
+        import ijson
+    except ImportError:  # ijson is optional; JSON files are loaded whole instead
+        return None
+    return ijson
+
+
+def _read_lines(filepath, line_numbers):
+    """
+    Read selected raw lines from a text file in a single pass
+    
+    Args:
+        filepath (str): Path to the file
+        line_numbers (set): 1-based line numbers to return
+        
+    Returns:
+        dict: Mapping of line number to raw line text
+    """
+    lines = {}
+    if not line_numbers:
+        return lines
+    
+    last = max(line_numbers)
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            if line_num in line_numbers:
+                lines[line_num] = line
+            if line_num >= last:
+                break
+    
+    return lines
+
+
+def _column_positions(header):
+    """
+    Resolve the column index of each FLIGHT_FIELDS entry from a header row
+    
+    Args:
+        header (list): Header field names
+        
+    Returns:
+        tuple: One index per field; len(header) for columns that are
+            missing, a slot _check_row always leaves blank
+    """
+    width = len(header)
+    columns = {name.strip(): i for i, name in enumerate(header)}
+    return tuple(columns.get(name, width) for name in FLIGHT_FIELDS)
+
+
+def _read_csv_frame(filepath):
+    """
+    Read a CSV file into an all-string DataFrame
+    
+    Blank lines are kept as rows so row positions map back to line
+    numbers. Uses pyarrow's reader when possible, pandas' C reader
+    otherwise.
+    
+    Args:
+        filepath (str): Path to the CSV file
+        
+    Returns:
+        pandas.DataFrame or None: Raw string columns, or None if the file
+            is empty
+            
+    Raises:
+        pandas.errors.ParserError: If a row has more fields than the first
+            data row
+    """
+    pd = _load_pandas()
+    if _load_pyarrow() is not None:
+        df = _read_csv_frame_arrow(filepath)
+        if df is not None:
+            return df
+    
+    try:
+        # index_col=False stops an overlong first row from turning the first
+        # column into the index; its overflow fields are dropped instead,
+        # as DictReader did, and pandas' warning about that is silenced
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', pd.errors.ParserWarning)
+            return pd.read_csv(filepath, dtype=str, skipinitialspace=True,
+                               engine='c', keep_default_na=False,
+                               skip_blank_lines=False, encoding='utf-8',
+                               index_col=False)
+    except pd.errors.EmptyDataError:
+        return None
+
+
+def _read_csv_frame_arrow(filepath):
+    """
+    Read a CSV file with pyarrow's memory-mapped, multithreaded reader
+    
+    Args:
+        filepath (str): Path to the CSV file
+        
+    Returns:
+        pandas.DataFrame or None: Raw string columns, or None when the file
+            is empty, contains quotes or has rows pyarrow cannot place
+            (e.g. short rows); those are left to the pandas reader
+    """
+    pa, pc, pacsv = _load_pyarrow()
+    
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        header = next(csv.reader(f), None)
+    if not header:
+        return None
+    
+    # pyarrow has no skipinitialspace, so a quoted field after ', ' keeps
+    # its quotes; leave any file with quotes to the pandas reader
+    with open(filepath, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if data.find(b'"') != -1:
+            return None
+    
+    # pandas renames blank and repeated header names; leave those to it too
+    names = [name.lstrip(' ') for name in header]
+    if '' in names or len(set(names)) != len(names):
+        return None
+    
+    # No invalid_row_handler: pyarrow would call it from its worker threads,
+    # which can abort the interpreter at exit. Without one, a row of the
+    # wrong width raises ArrowInvalid, and such files go to pandas anyway
+    # since skipped rows would shift the line numbers after them.
+    try:
+        with pa.memory_map(filepath) as source:
+            table = pacsv.read_csv(
+                source,
+                parse_options=pacsv.ParseOptions(ignore_empty_lines=False),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={name: pa.string() for name in header},
+                    strings_can_be_null=False
+                )
+            )
+    except pa.ArrowInvalid:
+        return None
+    
+    # A header read differently (e.g. a byte order mark) left columns untyped
+    if table.column_names != header:
+        return None
+    
+    # Match skipinitialspace: drop the spaces (only) that start each field
+    columns = [pc.utf8_ltrim(column, characters=' ') for column in table.columns]
+    return pa.table(columns, names=names).to_pandas()
+
+
+def _packed_codes(column, packed):
+    """
+    Map a column of airport codes to their packed integers
+    
+    Args:
+        column (pandas.Series): Airport code strings
+        packed (dict): Known airport code -> pack_airport_code value
+        
+    Returns:
+        numpy.ndarray: int64 packed codes, -1 for unknown codes
+    """
+    return column.map(packed).fillna(-1).to_numpy(dtype='int64')
+
+
+def _datetime_keys(column):
+    """
+    Parse a column of '%m/%d/%Y %H:%M' strings into YYYYMMDDHHMM keys
+    
+    Args:
+        column (pandas.Series): Datetime strings
+        
+    Returns:
+        numpy.ndarray: int64 keys, -1 where the string is invalid
+    """
+    pd = _load_pandas()
+    dt = pd.to_datetime(column, format='%m/%d/%Y %H:%M', errors='coerce').dt
+    keys = (((dt.year * 100 + dt.month) * 100 + dt.day) * 100
+            + dt.hour) * 100 + dt.minute
+    return keys.fillna(-1).to_numpy(dtype='int64')
+
+
+def _parse_csv_file(validator, filepath):
+    """
+    Parse one CSV file in a worker process
+    
+    Args:
+        validator (FlightValidator): Validator instance for flight data
+        filepath (str): Path to the CSV file
+        
+    Returns:
+        tuple: (valid_flights, errors) with errors tagged by filename;
+            valid_flights is a FlightTable
+    """
+    valid_flights, errors = CSVParser(validator).parse_file_vectorized(filepath)
+    
+    # Add filename context to errors for better tracking
+    filename = Path(filepath).name
+    for error in errors:
+        error['filename'] = filename
+    
+    return valid_flights, errors
+
 
 class CSVParser:
     """Parse CSV flight data files"""
@@ -24,62 +289,336 @@ class CSVParser:
         """
         Parse a single CSV file
         
+        Uses the compiled scanner from _fastparse when it has been built.
+        
         Args:
             filepath (str): Path to the CSV file
             
         Returns:
             tuple: (valid_flights, errors)
-                - valid_flights (list): List of valid flight dictionaries
+                - valid_flights (FlightTable): Valid flights, stored by column
                 - errors (list): List of error dictionaries
         """
-        valid_flights = []
+        result = self._parse_file_compiled(filepath)
+        if result is not None:
+            return result
+        
+        return self._parse_file_streaming(filepath)
+    
+    def _parse_file_streaming(self, filepath):
+        """
+        Parse a CSV file row by row with csv.reader
+        
+        Args:
+            filepath (str): Path to the CSV file
+            
+        Returns:
+            tuple: (valid_flights, errors) as for parse_file
+        """
+        valid_flights = FlightTable()
+        errors = []
+        
+        try:
+            with open(filepath, 'r', encoding='utf-8', buffering=1 << 20) as f:
+                # Stream the file through the reader; raw lines are only
+                # read back for the rows that end up as errors
+                reader = csv.reader(f, skipinitialspace=True)
+                
+                # Resolve column positions from the header once
+                header = next(reader, None)
+                if header is None:
+                    return valid_flights, errors
+                
+                positions = _column_positions(header)
+                padding = [''] * (len(header) + 1)
+                
+                for row in reader:
+                    # reader.line_num accounts for the header and blank lines
+                    typed_flight, reason = self._check_row(row, positions,
+                                                           padding)
+                    
+                    if typed_flight is not None:
+                        valid_flights.append(typed_flight)
+                    elif reason is not None:
+                        # Record error with line number and reason
+                        errors.append({
+                            'line_number': reader.line_num,
+                            'content': None,
+                            'reason': reason
+                        })
+            
+            # Fill in the raw content of error lines with one extra pass
+            raw_lines = _read_lines(filepath,
+                                    {error['line_number'] for error in errors})
+            for error in errors:
+                error['content'] = raw_lines.get(error['line_number'], '').strip()
+        
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {filepath}")
+        except Exception as e:
+            raise Exception(f"Error parsing CSV: {e}")
+        
+        return valid_flights, errors
+    
+    def _check_row(self, row, positions, padding):
+        """
+        Validate one parsed CSV row
+        
+        Args:
+            row (list): Field strings from csv.reader
+            positions (tuple): Column index of each FLIGHT_FIELDS entry
+            padding (list): len(header) + 1 empty strings used to pad rows
+            
+        Returns:
+            tuple: (typed_flight, reason)
+                - typed_flight (dict or None): The flight, if valid
+                - reason (str or None): Error reason, if the row is an error;
+                  both are None for empty lines
+        """
+        # Skip empty lines
+        if len(row) <= 1 and not (row and row[0].strip()):
+            return None, None
+        
+        # Skip comment lines (starting with #)
+        if row[0].lstrip().startswith('#'):
+            return None, 'comment line, ignored for data parsing'
+        
+        # Drop overflow fields, as DictReader did, then pad to one slot past
+        # the header; that slot stays blank and stands in for missing columns
+        width = len(padding) - 1
+        if len(row) > width:
+            row = row[:width]
+        row = row + padding[len(row):]
+        
+        fid_i, org_i, dst_i, dep_i, arr_i, price_i = positions
+        flight_data = {
+            'flight_id': row[fid_i].strip(),
+            'origin': row[org_i].strip(),
+            'destination': row[dst_i].strip(),
+            'departure_datetime': row[dep_i].strip(),
+            'arrival_datetime': row[arr_i].strip(),
+            'price': row[price_i].strip()
+        }
+        
+        # Validate the flight data
+        is_valid, error_messages = self.validator.validate_flight(flight_data)
+        
+        if not is_valid:
+            return None, ', '.join(error_messages)
+        
+        # Convert to proper types
+        return self.validator.convert_to_typed_flight(flight_data), None
+    
+    def _parse_file_compiled(self, filepath):
+        """
+        Parse a CSV file with the compiled scanner from _fastparse
+        
+        Only plain files are handled: ASCII, no quotes, no NUL bytes and
+        no bare carriage returns. The file is memory-mapped and scanned in
+        place. Rows the scanner cannot accept outright are finished by
+        _check_row.
+        
+        Args:
+            filepath (str): Path to the CSV file
+            
+        Returns:
+            tuple or None: (valid_flights, errors) as for parse_file, or
+                None if the file needs the Python parser, the scanner is
+                not built or the validator is not the stock one
+        """
+        # The compiled scanner applies the stock validation rules itself
+        fastparse = _load_fastparse()
+        if fastparse is None or type(self.validator) is not FlightValidator:
+            return None
+        
+        try:
+            f = open(filepath, 'rb')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {filepath}")
+        
+        with f:
+            # mmap cannot map an empty file, which has no header anyway
+            if os.fstat(f.fileno()).st_size == 0:
+                return FlightTable(), []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                header_end = data.find(b'\n')
+                if header_end < 0:
+                    header_end = len(data)
+                line = data[:header_end]
+                if header_end < len(data) and line.endswith(b'\r'):
+                    line = line[:-1]
+                if (not line.isascii() or b'"' in line or b'\0' in line
+                        or b'\r' in line):
+                    return None
+                header = next(csv.reader([line.decode('ascii')],
+                                         skipinitialspace=True), None)
+                if header is None:
+                    return FlightTable(), []
+                
+                positions = _column_positions(header)
+                scanned = fastparse.scan_rows(
+                    data, header_end + 1, len(header), positions,
+                    VALID_AIRPORTS_PACKED)
+        if scanned is None:
+            return None
+        columns, valid_lines, pending = scanned
+        valid_flights = FlightTable.from_columns(*columns)
+        
+        padding = [''] * (len(header) + 1)
         errors = []
+        rescued = []
+        
+        for line_num, line in pending:
+            row = next(csv.reader([line], skipinitialspace=True), [])
+            typed_flight, reason = self._check_row(row, positions, padding)
+            
+            if typed_flight is not None:
+                rescued.append((line_num, typed_flight))
+            elif reason is not None:
+                errors.append({
+                    'line_number': line_num,
+                    'content': line.strip(),
+                    'reason': reason
+                })
+        
+        # Slot rows the scanner passed over back into file order
+        if rescued:
+            merged = FlightTable()
+            rows = iter(zip(valid_lines, valid_flights))
+            for line_num, typed_flight in sorted(rescued, key=lambda r: r[0]):
+                for valid_line, flight in rows:
+                    if valid_line > line_num:
+                        merged.append(typed_flight)
+                        merged.append(flight)
+                        break
+                    merged.append(flight)
+                else:
+                    merged.append(typed_flight)
+            for valid_line, flight in rows:
+                merged.append(flight)
+            valid_flights = merged
+        
+        return valid_flights, errors
+    
+    def parse_file_vectorized(self, filepath):
+        """
+        Parse a single CSV file using column-wise pandas validation
+        
+        The compiled scanner from _fastparse is used instead when it has
+        been built and accepts the file. Otherwise the file is read with
+        pyarrow when available. Rows are checked as whole columns; only the
+        rows that fail are passed through the validator to build their
+        error reasons. Falls back to row-by-row parsing when pandas is not
+        installed.
+        
+        Args:
+            filepath (str): Path to the CSV file
+            
+        Returns:
+            tuple: (valid_flights, errors)
+                - valid_flights (FlightTable): Valid flights, stored by column
+                - errors (list): List of error dictionaries
+        """
+        result = self._parse_file_compiled(filepath)
+        if result is not None:
+            return result
+        
+        pd = _load_pandas()
+        if pd is None:
+            return self._parse_file_streaming(filepath)
+        
+        try:
+            df = _read_csv_frame(filepath)
+        except pd.errors.ParserError:
+            # The C tokenizer rejects rows longer than the first data row;
+            # the streaming parser drops their overflow fields instead
+            return self._parse_file_streaming(filepath)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {filepath}")
+        except Exception as e:
+            raise Exception(f"Error parsing CSV: {e}")
+        
+        if df is None:
+            return FlightTable(), []
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                # Read all lines to track line numbers
-                lines = f.readlines()
+            df.columns = [str(name).strip() for name in df.columns]
+            df = df.fillna('')
+            
+            for name in FLIGHT_FIELDS:
+                if name in df.columns:
+                    df[name] = df[name].str.strip()
+                else:
+                    df[name] = ''
+            
+            first_column = df[df.columns[0]]
+            comment = first_column.str.startswith('#')
             
-            # Use csv.DictReader for parsing
-            reader = csv.DictReader(lines, skipinitialspace=True)
+            # Reduce each column to the typed arrays validate_batch expects
+            fid_ok = df['flight_id'].str.fullmatch(r'[A-Za-z0-9]{2,8}')
+            packed = {code: pack_airport_code(code) for code in VALID_AIRPORTS}
+            price = pd.to_numeric(df['price'], errors='coerce')
             
-            # Track line number (accounting for header)
-            line_num = 1  # Header is line 1
+            codes = self.validator.validate_batch(
+                fid_ok.to_numpy(dtype=bool),
+                _packed_codes(df['origin'], packed),
+                _packed_codes(df['destination'], packed),
+                _datetime_keys(df['departure_datetime']),
+                _datetime_keys(df['arrival_datetime']),
+                price.fillna(0.0).to_numpy(dtype='float64'),
+                price.notna().to_numpy(dtype=bool)
+            )
+            valid = (codes == 0) & ~comment.to_numpy(dtype=bool)
             
-            for raw_line, row in zip(lines[1:], reader):  # Skip header in lines
-                line_num += 1
+            # Line 1 is the header and blank lines are kept as rows, so row
+            # positions map straight to line numbers
+            failing = (~valid).nonzero()[0]
+            raw_lines = _read_lines(filepath, {int(pos) + 2 for pos in failing})
+            errors = []
+            
+            # Pull the failing rows out column by column in one go; per-row
+            # DataFrame lookups cost as much as parsing the whole file
+            failing_rows = zip(
+                failing.tolist(),
+                comment.to_numpy(dtype=bool)[failing].tolist(),
+                *(df[name].to_numpy()[failing].tolist() for name in FLIGHT_FIELDS)
+            )
+            
+            for pos, is_comment, *values in failing_rows:
+                line_num = pos + 2
+                content = raw_lines.get(line_num, '').strip()
                 
                 # Skip empty lines
-                if not raw_line.strip():
+                if not content:
                     continue
                 
-                # Skip comment lines (starting with #)
-                if raw_line.strip().startswith('#'):
+                if is_comment:
                     errors.append({
                         'line_number': line_num,
-                        'content': raw_line.strip(),
+                        'content': content,
                         'reason': 'comment line, ignored for data parsing'
                     })
                     continue
                 
-                # Clean the row data (strip whitespace from keys and values)
-                flight_data = {k.strip(): v.strip() if v else '' 
-                              for k, v in row.items() if k}
-                
-                # Validate the flight data
+                # The validator renders the reasons (and has the final say)
+                flight_data = dict(zip(FLIGHT_FIELDS, values))
                 is_valid, error_messages = self.validator.validate_flight(flight_data)
                 
                 if is_valid:
-                    # Convert to proper types and add to valid flights
-                    typed_flight = self.validator.convert_to_typed_flight(flight_data)
-                    valid_flights.append(typed_flight)
+                    valid[pos] = True
                 else:
-                    # Record error with line number and reason
                     errors.append({
                         'line_number': line_num,
-                        'content': raw_line.strip(),
+                        'content': content,
                         'reason': ', '.join(error_messages)
                     })
+            
+            flights = df.loc[valid]
+            valid_flights = FlightTable.from_columns(
+                flights['flight_id'], flights['origin'], flights['destination'],
+                flights['departure_datetime'], flights['arrival_datetime'],
+                (float(price) for price in flights['price'])
+            )
         
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {filepath}")
@@ -97,42 +636,83 @@ class CSVParser:
             
         Returns:
             tuple: (combined_valid_flights, combined_errors)
-                - combined_valid_flights (list): All valid flights from all files
+                - combined_valid_flights (FlightTable): All valid flights from all files
                 - combined_errors (list): All errors from all files
         """
+        all_valid_flights = FlightTable()
+        all_errors = []
+        
+        # Merge per-file results in file order
+        for valid_flights, errors in self.iter_directory(directory):
+            all_valid_flights.extend(valid_flights)
+            all_errors.extend(errors)
+        
+        return all_valid_flights, all_errors
+    
+    def iter_directory(self, directory):
+        """
+        Parse all CSV files in a directory, yielding results file by file
+        
+        The directory is checked immediately; files are parsed lazily as
+        the returned iterator is consumed.
+        
+        Args:
+            directory (str): Path to directory containing CSV files
+            
+        Returns:
+            iterator: (valid_flights, errors) for each file, in filename
+                order; errors carry a 'filename' key
+                
+        Raises:
+            ValueError: If directory doesn't exist
+        """
         dir_path = Path(directory)
         
         if not dir_path.exists() or not dir_path.is_dir():
             raise ValueError(f"Invalid directory: {directory}")
         
-        all_valid_flights = []
-        all_errors = []
-        
         # Find all CSV files in the directory
         csv_files = sorted(dir_path.glob('*.csv'))
         
         if not csv_files:
             print(f"Warning: No CSV files found in {directory}")
-            return all_valid_flights, all_errors
         
-        # Parse each file
-        for csv_file in csv_files:
-            print(f"  Processing: {csv_file.name}")
-            valid_flights, errors = self.parse_file(str(csv_file))
-            
-            # Add filename context to errors for better tracking
-            for error in errors:
-                error['filename'] = csv_file.name
+        return self._iter_files(csv_files)
+    
+    def _iter_files(self, csv_files):
+        """
+        Parse CSV files, yielding each file's results in order
+        
+        Args:
+            csv_files (list): Paths of the CSV files to parse
             
-            all_valid_flights.extend(valid_flights)
-            all_errors.extend(errors)
+        Yields:
+            tuple: (valid_flights, errors) for each file
+        """
+        paths = [str(csv_file) for csv_file in csv_files]
         
-        return all_valid_flights, all_errors
+        # Files are independent, so parse them in parallel worker processes
+        if len(paths) <= 1:
+            for csv_file, path in zip(csv_files, paths):
+                print(f"  Processing: {csv_file.name}")
+                yield _parse_csv_file(self.validator, path)
+            return
+        
+        workers = min(len(paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_parse_csv_file, repeat(self.validator),
+                                   paths)
+            for csv_file, result in zip(csv_files, results):
+                print(f"  Processing: {csv_file.name}")
+                yield result
 
 
 class JSONParser:
     """Parse and load JSON flight databases"""
     
+    # File size from which iter_load streams records instead of loading
+    STREAM_MIN_BYTES = 32 << 20
+    
     def load(self, filepath):
         """
         Load flights from JSON file
@@ -148,8 +728,7 @@ class JSONParser:
             ValueError: If JSON is invalid or not an array
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(filepath)
             
             # Validate that it's a list
             if not isinstance(data, list):
@@ -160,4 +739,79 @@ class JSONParser:
         except FileNotFoundError:
             raise FileNotFoundError(f"JSON file not found: {filepath}")
         except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON format: {e}")
\ No newline at end of file
+            raise ValueError(f"Invalid JSON format: {e}")
+    
+    def iter_load(self, filepath):
+        """
+        Iterate over the flights of a JSON file
+        
+        Large files are streamed record by record with ijson, so the whole
+        array is never held in memory; small files, files holding the
+        NaN/Infinity tokens ijson rejects, or any file when ijson is not
+        installed, are loaded with load().
+        
+        Args:
+            filepath (str): Path to JSON file
+            
+        Returns:
+            iterator: Flight dictionaries in file order
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If JSON is invalid or not an array (raised while
+                iterating when the file is streamed)
+        """
+        try:
+            size = os.path.getsize(filepath)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"JSON file not found: {filepath}")
+        
+        if (size < self.STREAM_MIN_BYTES or _load_ijson() is None
+                or self._has_non_finite_tokens(filepath)):
+            return iter(self.load(filepath))
+        
+        return self._iter_items(filepath)
+    
+    @staticmethod
+    def _has_non_finite_tokens(filepath):
+        """
+        Check whether a JSON file may hold NaN or Infinity number tokens
+        
+        json writes non-finite prices that way and ijson rejects them. The
+        text is searched without parsing, so a string containing either
+        word also counts; such files are merely loaded instead of streamed.
+        
+        Args:
+            filepath (str): Path to a non-empty JSON file
+            
+        Returns:
+            bool: True if the file contains NaN or Infinity
+        """
+        with open(filepath, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return data.find(b'NaN') != -1 or data.find(b'Infinity') != -1
+    
+    def _iter_items(self, filepath):
+        """
+        Stream the elements of a top-level JSON array with ijson
+        
+        Args:
+            filepath (str): Path to JSON file
+            
+        Yields:
+            dict: Flight dictionaries; non-integer numbers come back as
+                floats, as with json.load
+        """
+        ijson = _load_ijson()
+        
+        with open(filepath, 'rb') as f:
+            # ijson yields nothing for a non-array document; reject it
+            head = f.read(4096).lstrip()
+            if not head.startswith(b'['):
+                raise ValueError("JSON file must contain an array of flight objects")
+            f.seek(0)
+            
+            try:
+                yield from ijson.items(f, 'item', use_float=True)
+            except ijson.JSONError as e:
+                raise ValueError(f"Invalid JSON format: {e}")
@@ -3,22 +3,245 @@ Query engine for filtering flight data
 Handles query execution and filtering logic
 """
 
-import json
-from datetime import datetime
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Sequence
+from functools import lru_cache
+
+from flight_table import FLIGHT_FIELDS, FlightTable
+from utils import load_json
+from validator import parse_ymd_datetime
+
+
+@lru_cache(maxsize=None)
+def _load_fastquery():
+    """
+    Import the Numba-compiled matcher on first use
+    
+    Returns:
+        module or None: _fastquery, or None if numba is not installed
+    """
+    try:
+        import _fastquery
+    except ImportError:  # numba is optional; queries stay in pure Python
+        return None
+    return _fastquery
+
+
+def _collect_flights(flights):
+    """
+    Consume an iterable of flight dictionaries into a FlightTable
+    
+    Records shaped like the parser's typed output (FLIGHT_FIELDS in order,
+    float price) are stored column by column and the dictionaries dropped.
+    Any other record cannot be stored that way without changing it, so from
+    the first such record on the flights are kept as a plain list.
+    
+    Args:
+        flights (iterable): Flight dictionaries, consumed once
+        
+    Returns:
+        FlightTable or list: The flights, in order
+    """
+    table = FlightTable()
+    flights = iter(flights)
+    for flight in flights:
+        if tuple(flight) != FLIGHT_FIELDS or type(flight['price']) is not float:
+            collected = table.to_dicts()
+            collected.append(flight)
+            collected.extend(flights)
+            return collected
+        table.append(flight)
+    return table
 
 
 class QueryEngine:
     """Execute queries on flight database"""
     
-    def __init__(self, flights):
+    # Fields matched by equality, each backed by a hash index
+    EXACT_MATCH_FIELDS = ('flight_id', 'origin', 'destination')
+    
+    # Candidate count from which a compiled engine scans with Numba; below
+    # it the indexed Python path is as fast
+    COMPILED_SCAN_MIN = 50000
+    
+    def __init__(self, flights, compiled=False):
         """
         Initialize query engine with flight data
         
         Args:
-            flights (list): List of flight dictionaries to query
+            flights (list, FlightTable or iterable): Flights to query; other
+                iterables (e.g. JSONParser.iter_load) are consumed once
+            compiled (bool): Scan large candidate sets with the Numba
+                matcher from _fastquery when numba is installed. Off by
+                default: importing numba and loading the kernel costs a
+                few tenths of a second per process, which only many large
+                queries win back.
         """
+        self._compiled = compiled
+        self._columns = None
+        
+        if not isinstance(flights, (Sequence, FlightTable)):
+            flights = _collect_flights(flights)
         self.flights = flights
-        self.datetime_format = '%Y-%m-%d %H:%M'
+        
+        # Work on one sequence per field; a FlightTable already stores
+        # its flights that way, plain dicts are split up once here
+        if isinstance(flights, FlightTable):
+            self._field_values = {field: flights.column(field)
+                                  for field in self.EXACT_MATCH_FIELDS}
+            departures = flights.departure_datetime
+            arrivals = flights.arrival_datetime
+            # Table prices were validated and converted on the way in
+            self._prices = flights.price
+        else:
+            self._field_values = {field: [flight.get(field) for flight in flights]
+                                  for field in self.EXACT_MATCH_FIELDS}
+            departures = [flight.get('departure_datetime') for flight in flights]
+            arrivals = [flight.get('arrival_datetime') for flight in flights]
+            self._prices = [self._parse_price(flight) for flight in flights]
+        
+        # Parse every flight's datetimes once so queries compare integers
+        self._dep_ts = [self._parse_datetime(value) for value in departures]
+        self._arr_ts = [self._parse_datetime(value) for value in arrivals]
+        
+        # Flight indices sorted by departure/arrival for range bisection;
+        # flights with unparseable datetimes never match a range anyway
+        self._dep_sorted = self._sorted_by(self._dep_ts)
+        self._dep_ts_sorted = [self._dep_ts[i] for i in self._dep_sorted]
+        self._arr_sorted = self._sorted_by(self._arr_ts)
+        self._arr_ts_sorted = [self._arr_ts[i] for i in self._arr_sorted]
+        
+        # Hash indexes: field -> value -> ascending flight indices
+        self._indexes = {field: defaultdict(list)
+                         for field in self.EXACT_MATCH_FIELDS}
+        for field, index in self._indexes.items():
+            for i, value in enumerate(self._field_values[field]):
+                try:
+                    index[value].append(i)
+                except TypeError:
+                    # Unhashable values can never equal a query value
+                    continue
+    
+    def _build_columns(self, fastquery):
+        """
+        Build the NumPy column arrays scanned by the compiled matcher
+        
+        Equality fields are encoded as integer codes (the position of the
+        value in its hash index, recorded in self._value_codes); -2 marks
+        values that were not indexed. A second copy of every column, laid
+        out in departure order (self._dep_columns), lets departure range
+        queries scan one contiguous suffix instead of striding over the
+        whole table.
+        
+        Args:
+            fastquery (module): The loaded _fastquery module
+            
+        Returns:
+            dict: Column name -> C-contiguous NumPy array, one entry per flight
+        """
+        import numpy as np
+        
+        n = len(self.flights)
+        columns = {
+            'dep_ts': np.array([fastquery.NO_DEPARTURE if ts is None else ts
+                                for ts in self._dep_ts], dtype=np.int64),
+            'arr_ts': np.array([fastquery.NO_ARRIVAL if ts is None else ts
+                                for ts in self._arr_ts], dtype=np.int64),
+        }
+        
+        if isinstance(self._prices, array):
+            # Table prices are already packed doubles with no gaps; copy
+            # them in one block so the table stays resizable
+            columns['price'] = np.array(self._prices, dtype=np.float64)
+            columns['price_ok'] = np.ones(n, dtype=np.bool_)
+        else:
+            columns['price'] = np.array([0.0 if price is None else price
+                                         for price in self._prices],
+                                        dtype=np.float64)
+            columns['price_ok'] = np.array([price is not None
+                                            for price in self._prices],
+                                           dtype=np.bool_)
+        
+        self._value_codes = {}
+        for field, index in self._indexes.items():
+            codes = np.full(n, -2, dtype=np.int64)
+            value_codes = {}
+            for code, (value, indices) in enumerate(index.items()):
+                codes[indices] = code
+                value_codes[value] = code
+            columns[field] = codes
+            self._value_codes[field] = value_codes
+        
+        columns = {name: np.ascontiguousarray(column)
+                   for name, column in columns.items()}
+        
+        # Departure-ordered copies; fancy indexing returns fresh contiguous
+        # arrays, so any suffix of them is contiguous as well
+        self._dep_order = np.array(self._dep_sorted, dtype=np.int64)
+        self._dep_columns = {name: column[self._dep_order]
+                             for name, column in columns.items()}
+        
+        return columns
+    
+    def _query_code(self, field, value):
+        """
+        Encode an exact-match query value for the compiled matcher
+        
+        Args:
+            field (str): Exact-match field name
+            value: Query value for the field
+            
+        Returns:
+            int or None: Integer code of the value, or None if no flight has it
+        """
+        try:
+            return self._value_codes[field].get(value)
+        except TypeError:
+            return None
+    
+    @staticmethod
+    def _sorted_by(timestamps):
+        """
+        Order flight indices by timestamp, dropping unparseable entries
+        
+        Args:
+            timestamps (list): Per-flight integer keys or None
+            
+        Returns:
+            list: Flight indices in ascending timestamp order
+        """
+        return sorted((i for i, ts in enumerate(timestamps) if ts is not None),
+                      key=timestamps.__getitem__)
+    
+    def _parse_datetime(self, value):
+        """
+        Convert a '%Y-%m-%d %H:%M' datetime string to a sortable integer
+        
+        Args:
+            value (str): Datetime string to convert
+            
+        Returns:
+            int or None: YYYYMMDDHHMM as an integer, or None if unparseable
+        """
+        return parse_ymd_datetime(value)
+    
+    @staticmethod
+    def _parse_price(flight):
+        """
+        Read a flight's price as a float
+        
+        Args:
+            flight (dict): Flight data
+            
+        Returns:
+            float or None: The price, or None if missing or unparseable
+        """
+        try:
+            return float(flight['price'])
+        except (ValueError, TypeError, KeyError):
+            return None
     
     def execute_query(self, query):
         """
@@ -36,69 +259,238 @@ class QueryEngine:
         Returns:
             list: List of flights matching all query criteria
         """
+        # Parse the query thresholds once instead of once per flight
+        thresholds = self._parse_query(query)
+        if thresholds is None:
+            return []
+        exact, query_dep, query_arr, query_price = thresholds
+        
+        # Only scan flights from the smallest matching index bucket
+        candidates = self._candidate_indices(exact, query_dep, query_arr)
+        
+        if self._compiled and len(candidates) >= self.COMPILED_SCAN_MIN:
+            matches = self._execute_compiled(dict(exact), query_dep,
+                                             query_arr, query_price)
+            if matches is not None:
+                return matches
+        
+        predicates = self._build_predicates(exact, query_dep, query_arr,
+                                            query_price)
         matches = []
+        flights = self.flights
         
-        for flight in self.flights:
-            if self._flight_matches_query(flight, query):
-                matches.append(flight)
+        for i in candidates:
+            # Stop at the first failing check; keep the flight otherwise
+            for predicate in predicates:
+                if not predicate(i):
+                    break
+            else:
+                matches.append(flights[i])
         
         return matches
     
-    def _flight_matches_query(self, flight, query):
+    def _parse_query(self, query):
         """
-        Check if a flight matches all query criteria
+        Parse a query's criteria into loop-invariant thresholds
         
         Args:
-            flight (dict): Flight data to check
-            query (dict): Query criteria to match against
+            query (dict): Dictionary containing query criteria
             
         Returns:
-            bool: True if flight matches all criteria, False otherwise
+            tuple or None: (exact, query_dep, query_arr, query_price), where
+                exact is a tuple of (field, value) pairs and absent criteria
+                are None; None if any datetime or price is unparseable
         """
+        exact = tuple((field, query[field])
+                      for field in self.EXACT_MATCH_FIELDS
+                      if field in query)
         
-        # Exact match fields: flight_id, origin, destination
-        exact_match_fields = ['flight_id', 'origin', 'destination']
-        for field in exact_match_fields:
-            if field in query:
-                if flight.get(field) != query[field]:
-                    return False
+        query_dep = query_arr = query_price = None
         
-        # departure_datetime: include flights departing >= query value
         if 'departure_datetime' in query:
-            try:
-                query_dt = datetime.strptime(query['departure_datetime'], 
-                                            self.datetime_format)
-                flight_dt = datetime.strptime(flight['departure_datetime'], 
-                                             self.datetime_format)
-                if flight_dt < query_dt:
-                    return False
-            except (ValueError, KeyError):
-                return False
+            query_dep = self._parse_datetime(query['departure_datetime'])
+            if query_dep is None:
+                return None
         
-        # arrival_datetime: include flights arriving <= query value
         if 'arrival_datetime' in query:
-            try:
-                query_dt = datetime.strptime(query['arrival_datetime'], 
-                                            self.datetime_format)
-                flight_dt = datetime.strptime(flight['arrival_datetime'], 
-                                             self.datetime_format)
-                if flight_dt > query_dt:
-                    return False
-            except (ValueError, KeyError):
-                return False
+            query_arr = self._parse_datetime(query['arrival_datetime'])
+            if query_arr is None:
+                return None
         
-        # price: include flights with price <= query value
         if 'price' in query:
             try:
                 query_price = float(query['price'])
-                flight_price = float(flight['price'])
-                if flight_price > query_price:
-                    return False
-            except (ValueError, KeyError):
-                return False
+            except (ValueError, TypeError):
+                return None
+        
+        return exact, query_dep, query_arr, query_price
+    
+    def _execute_compiled(self, exact, query_dep, query_arr, query_price):
+        """
+        Scan every flight with the compiled matcher
+        
+        The NumPy columns are built on the first compiled scan.
+        
+        Args:
+            exact (dict): Field -> value pairs that must match exactly
+            query_dep (int or None): Earliest departure, or None to skip
+            query_arr (int or None): Latest arrival, or None to skip
+            query_price (float or None): Maximum price, or None to skip
+            
+        Returns:
+            list or None: Matching flight dictionaries in original order,
+                or None if numba is not installed
+        """
+        fastquery = _load_fastquery()
+        if fastquery is None:
+            return None
+        
+        import numpy as np
+        
+        if self._columns is None:
+            self._columns = self._build_columns(fastquery)
+        
+        codes = []
+        for field in self.EXACT_MATCH_FIELDS:
+            if field in exact:
+                code = self._query_code(field, exact[field])
+                if code is None:
+                    return []
+                codes.append(code)
+            else:
+                codes.append(-1)
+        
+        # With a departure bound only the sorted suffix can match, so scan
+        # that slice of the departure-ordered columns front to back
+        if query_dep is not None:
+            start = np.searchsorted(self._dep_columns['dep_ts'], query_dep)
+            columns = {name: column[start:]
+                       for name, column in self._dep_columns.items()}
+            order = self._dep_order[start:]
+        else:
+            columns = self._columns
+            order = None
+        
+        out = np.empty(columns['dep_ts'].shape[0], dtype=np.bool_)
+        fastquery.match_flights(
+            columns['dep_ts'], columns['arr_ts'],
+            columns['price'], columns['price_ok'],
+            columns['flight_id'], columns['origin'], columns['destination'],
+            codes[0], codes[1], codes[2],
+            fastquery.NO_DEPARTURE if query_dep is None else query_dep,
+            fastquery.NO_ARRIVAL if query_arr is None else query_arr,
+            0.0 if query_price is None else query_price,
+            query_price is not None,
+            out
+        )
+        
+        hits = out.nonzero()[0]
+        if order is not None:
+            hits = np.sort(order[hits])
+        
+        flights = self.flights
+        return [flights[i] for i in hits]
+    
+    def _candidate_indices(self, exact, query_dep, query_arr):
+        """
+        Pick the smallest set of flight indices that could match a query
+        
+        Equality predicates use the hash indexes; datetime bounds use
+        bisection over the sorted departure/arrival keys.
+        
+        Args:
+            exact (tuple): (field, value) pairs that must match exactly
+            query_dep (int or None): Earliest departure, or None to skip
+            query_arr (int or None): Latest arrival, or None to skip
+            
+        Returns:
+            sequence: Ascending flight indices to check against the query
+        """
+        best = range(len(self.flights))
+        
+        for field, value in exact:
+            try:
+                bucket = self._indexes[field].get(value, ())
+            except TypeError:
+                return ()
+            if len(bucket) < len(best):
+                best = bucket
+        
+        # Range cuts: (sorted indices, start, stop), materialized only if used
+        best_range = None
+        
+        if query_dep is not None:
+            start = bisect_left(self._dep_ts_sorted, query_dep)
+            stop = len(self._dep_sorted)
+            if stop - start < len(best):
+                best = range(stop - start)
+                best_range = (self._dep_sorted, start, stop)
+        
+        if query_arr is not None:
+            stop = bisect_right(self._arr_ts_sorted, query_arr)
+            if stop < len(best):
+                best = range(stop)
+                best_range = (self._arr_sorted, 0, stop)
+        
+        if best_range is not None:
+            order, start, stop = best_range
+            # Restore original flight order for the results
+            return sorted(order[start:stop])
+        
+        return best
+    
+    def _build_predicates(self, exact, query_dep, query_arr, query_price):
+        """
+        Build the active per-flight checks for a query, most selective first
+        
+        Order: exact-match fields, then price, then datetimes. Inactive
+        criteria produce no check at all.
+        
+        Args:
+            exact (tuple): (field, value) pairs that must match exactly
+            query_dep (int or None): Earliest departure, or None to skip
+            query_arr (int or None): Latest arrival, or None to skip
+            query_price (float or None): Maximum price, or None to skip
+            
+        Returns:
+            list: Callables taking a flight index and returning a bool
+        """
+        predicates = []
+        
+        # Exact match fields: flight_id, origin, destination
+        for field, value in exact:
+            def matches_field(i, values=self._field_values[field], value=value):
+                return values[i] == value
+            predicates.append(matches_field)
+        
+        # price: include flights with price <= query value
+        if query_price is not None:
+            prices = self._prices
+            
+            def matches_price(i):
+                price = prices[i]
+                return price is not None and not price > query_price
+            predicates.append(matches_price)
+        
+        # departure_datetime: include flights departing >= query value
+        if query_dep is not None:
+            dep_ts = self._dep_ts
+            
+            def matches_departure(i):
+                ts = dep_ts[i]
+                return ts is not None and ts >= query_dep
+            predicates.append(matches_departure)
+        
+        # arrival_datetime: include flights arriving <= query value
+        if query_arr is not None:
+            arr_ts = self._arr_ts
+            
+            def matches_arrival(i):
+                ts = arr_ts[i]
+                return ts is not None and ts <= query_arr
+            predicates.append(matches_arrival)
         
-        # If all criteria passed, flight matches
-        return True
+        return predicates
     
     def execute_queries_from_file(self, query_file):
         """
@@ -116,8 +508,7 @@ class QueryEngine:
             ValueError: If query file format is invalid
         """
         # Load query file
-        with open(query_file, 'r', encoding='utf-8') as f:
-            queries = json.load(f)
+        queries = load_json(query_file)
         
         # Handle single query object or array of queries
         if isinstance(queries, dict):
@@ -0,0 +1,17 @@
+"""
+Build script for the optional compiled CSV scanner
+Run `python setup.py build_ext --inplace` to build _fastparse next to parser.py
+"""
+
+from setuptools import Extension, setup
+
+from Cython.Build import cythonize
+
+
+setup(
+    name='flight-schedule-parser',
+    ext_modules=cythonize(
+        [Extension('_fastparse', ['_fastparse.pyx'])],
+        language_level=3
+    ),
+)
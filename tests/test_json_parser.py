@@ -0,0 +1,42 @@
+"""
+Tests for JSONParser
+Streaming with ijson must yield what load() returns
+"""
+
+import math
+
+import pytest
+
+import parser
+from parser import JSONParser
+from utils import save_json
+
+
+FLIGHT = {'flight_id': 'BA1', 'origin': 'LHR', 'destination': 'JFK',
+          'departure_datetime': '2025-11-14 10:30',
+          'arrival_datetime': '2025-11-14 13:05', 'price': 100.5}
+
+
+@pytest.fixture
+def streaming(monkeypatch):
+    if parser._load_ijson() is None:
+        pytest.skip('ijson is not installed')
+    monkeypatch.setattr(JSONParser, 'STREAM_MIN_BYTES', 0)
+
+
+def test_streamed_flights_match_load(tmp_path, streaming):
+    path = tmp_path / 'db.json'
+    save_json([FLIGHT, dict(FLIGHT, price=7)], str(path))
+    
+    assert list(JSONParser().iter_load(str(path))) == JSONParser().load(str(path))
+
+
+def test_non_finite_prices_are_loaded(tmp_path, streaming):
+    path = tmp_path / 'db.json'
+    save_json([FLIGHT, dict(FLIGHT, price=float('nan')),
+               dict(FLIGHT, price=float('-inf'))], str(path))
+    
+    prices = [flight['price'] for flight in JSONParser().iter_load(str(path))]
+    assert prices[0] == 100.5
+    assert math.isnan(prices[1])
+    assert prices[2] == float('-inf')
@@ -0,0 +1,165 @@
+"""
+Tests for the CSV parsing paths
+The compiled scanner, the pandas/pyarrow path and the csv.reader path must agree
+"""
+
+from pathlib import Path
+
+import pytest
+
+import parser
+from parser import CSVParser
+from validator import FlightValidator
+
+
+HEADER = 'flight_id,origin,destination,departure_datetime,arrival_datetime,price'
+SAMPLE = Path(__file__).resolve().parent.parent / 'db.csv'
+
+CASES = {
+    'sample': SAMPLE.read_text(encoding='utf-8'),
+    'overlong_first_row': (
+        HEADER + '\n'
+        'BA1,LHR,JFK,11/14/2025 10:30,11/14/2025 13:05,100,codeshare\n'
+        'BA2,LHR,JFK,11/14/2025 10:30,11/14/2025 13:05,100\n'
+    ),
+    'overlong_later_row': (
+        HEADER + '\n'
+        'BA2,LHR,JFK,11/14/2025 10:30,11/14/2025 13:05,100\n'
+        'BA1,LHR,JFK,11/14/2025 10:30,11/14/2025 13:05,100,codeshare,x\n'
+        'BA3,LHR,XXX,11/14/2025 10:30,11/14/2025 13:05,100,codeshare\n'
+    ),
+    'missing_price_column': (
+        'flight_id,origin,destination,departure_datetime,arrival_datetime\n'
+        'BA1,LHR,JFK,11/14/2025 10:30,11/14/2025 13:05,100\n'
+        'BA2,LHR,JFK,11/14/2025 10:30,11/14/2025 13:05\n'
+    ),
+    'quoted_fields': (
+        HEADER + '\n'
+        'BA1, "LHR", "JFK", "11/14/2025 10:30", "11/14/2025 13:05", "100"\n'
+        'BA2,LHR,JFK,11/14/2025 10:30,11/14/2025 13:05,"1,5"\n'
+    ),
+    'short_blank_and_comment_rows': (
+        HEADER + '\n'
+        '\n'
+        '   # indented comment\n'
+        'BA1,LHR\n'
+        ',,,,,\n'
+        'BA2,LHR,JFK,11/14/2025 10:30,11/14/2025 13:05,100\n'
+        '\n'
+    ),
+    'crlf_and_padding': (
+        HEADER + '\r\n'
+        ' BA1 ,  LHR ,JFK\t,11/14/2025 10:30, 11/14/2025 13:05 , 100 \r\n'
+        '\r\n'
+        'BA2,LHR,JFK,2/29/2024 1:00,2/29/2024 2:00,7.5\r\n'
+        'BA3,LHR,JFK,2/29/2025 1:00,3/1/2025 2:00,7.5\r\n'
+    ),
+    'invalid_values': (
+        HEADER + '\n'
+        'B_1,LHR,JFK,11/14/2025 10:30,11/14/2025 13:05,100\n'
+        'BA1,lhr,JFK,11/14/2025 10:30,11/14/2025 13:05,100\n'
+        'BA1,LHR,JFK,13/14/2025 10:30,11/14/2025 13:05,100\n'
+        'BA1,LHR,JFK,11/14/2025 10:30,11/14/2025 10:30,100\n'
+        'BA1,LHR,JFK,11/14/2025 10:30,11/14/2025 13:05,-1\n'
+        'BA1,LHR,JFK,11/14/2025 10:30,11/14/2025 13:05,abc\n'
+        'BA1,LHR,JFK,11/14/2025 10:30,11/14/2025 13:05,0\n'
+    ),
+    'header_only': HEADER + '\n',
+}
+
+
+def _normalize(result):
+    """Turn a (FlightTable, errors) result into comparable plain data"""
+    valid_flights, errors = result
+    return valid_flights.to_dicts(), errors
+
+
+def _parse_streaming(filepath, monkeypatch):
+    return CSVParser(FlightValidator())._parse_file_streaming(filepath)
+
+
+def _parse_compiled(filepath, monkeypatch):
+    if parser._load_fastparse() is None:
+        pytest.skip('compiled scanner not built')
+    result = CSVParser(FlightValidator())._parse_file_compiled(filepath)
+    if result is None:
+        pytest.skip('file not handled by the compiled scanner')
+    return result
+
+
+def _parse_pyarrow(filepath, monkeypatch):
+    if parser._load_pandas() is None or parser._load_pyarrow() is None:
+        pytest.skip('pandas and pyarrow are required')
+    monkeypatch.setattr(parser, '_load_fastparse', lambda: None)
+    return CSVParser(FlightValidator()).parse_file_vectorized(filepath)
+
+
+def _parse_pandas(filepath, monkeypatch):
+    if parser._load_pandas() is None:
+        pytest.skip('pandas is required')
+    monkeypatch.setattr(parser, '_load_fastparse', lambda: None)
+    monkeypatch.setattr(parser, '_load_pyarrow', lambda: None)
+    return CSVParser(FlightValidator()).parse_file_vectorized(filepath)
+
+
+PATHS = {
+    'compiled': _parse_compiled,
+    'pyarrow': _parse_pyarrow,
+    'pandas': _parse_pandas,
+}
+
+
+@pytest.fixture(params=sorted(CASES))
+def csv_file(request, tmp_path):
+    """Write one test case to a CSV file"""
+    filepath = tmp_path / f'{request.param}.csv'
+    with open(filepath, 'w', encoding='utf-8', newline='') as f:
+        f.write(CASES[request.param])
+    return str(filepath)
+
+
+@pytest.mark.parametrize('path', sorted(PATHS))
+def test_paths_agree_with_streaming_parser(csv_file, path, monkeypatch):
+    expected = _normalize(_parse_streaming(csv_file, monkeypatch))
+    assert _normalize(PATHS[path](csv_file, monkeypatch)) == expected
+
+
+def test_sample_file():
+    valid_flights, errors = CSVParser(FlightValidator()).parse_file(str(SAMPLE))
+    
+    assert len(valid_flights) == 7
+    assert [error['line_number'] for error in errors] == [2] + list(range(10, 21))
+
+
+def _parse_case(name, tmp_path):
+    """Parse one of CASES with the default parse_file_vectorized path"""
+    filepath = tmp_path / f'{name}.csv'
+    with open(filepath, 'w', encoding='utf-8', newline='') as f:
+        f.write(CASES[name])
+    return CSVParser(FlightValidator()).parse_file_vectorized(str(filepath))
+
+
+def test_overlong_rows_drop_extra_fields(tmp_path):
+    valid_flights, errors = _parse_case('overlong_later_row', tmp_path)
+    
+    assert valid_flights.flight_id == ['BA2', 'BA1']
+    assert [(e['line_number'], e['reason']) for e in errors] == [
+        (4, 'invalid destination code')]
+
+
+def test_missing_header_column_stays_blank(tmp_path):
+    valid_flights, errors = _parse_case('missing_price_column', tmp_path)
+    
+    assert len(valid_flights) == 0
+    assert [e['reason'] for e in errors] == ['missing price field'] * 2
+
+
+def test_quoted_fields_after_spaces(tmp_path):
+    valid_flights, errors = _parse_case('quoted_fields', tmp_path)
+    
+    assert valid_flights.to_dicts() == [{
+        'flight_id': 'BA1', 'origin': 'LHR', 'destination': 'JFK',
+        'departure_datetime': '11/14/2025 10:30',
+        'arrival_datetime': '11/14/2025 13:05', 'price': 100.0
+    }]
+    assert [e['reason'] for e in errors] == ['invalid price format']
@@ -0,0 +1,44 @@
+"""
+Tests for QueryEngine
+The opt-in Numba matcher must return what the indexed Python path returns
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+import query_engine
+from parser import CSVParser
+from query_engine import QueryEngine
+from validator import FlightValidator
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+QUERIES = json.loads((ROOT / 'query.json').read_text(encoding='utf-8')) + [
+    {},
+    {'flight_id': 'BA2490'},
+    {'flight_id': 'NOPE'},
+    {'origin': 'LHR', 'price': 100},
+    {'departure_datetime': '2025-11-14 10:00', 'destination': 'JFK'},
+]
+
+
+@pytest.fixture(params=['list', 'table'])
+def flights(request):
+    table, _ = CSVParser(FlightValidator()).parse_file(str(ROOT / 'db.csv'))
+    return list(table) if request.param == 'list' else table
+
+
+def test_compiled_matches_python_path(flights, monkeypatch):
+    if query_engine._load_fastquery() is None:
+        pytest.skip('numba is not installed')
+    monkeypatch.setattr(QueryEngine, 'COMPILED_SCAN_MIN', 0)
+    
+    plain = QueryEngine(flights)
+    compiled = QueryEngine(flights, compiled=True)
+    
+    for query in QUERIES:
+        assert compiled.execute_query(query) == plain.execute_query(query)
+    assert compiled._columns is not None
@@ -0,0 +1,64 @@
+"""
+Tests for the JSON helpers
+Output must not depend on whether orjson is installed
+"""
+
+import math
+
+import pytest
+
+import utils
+from flight_table import FlightTable
+
+
+FLIGHTS = [
+    {'flight_id': 'BA1', 'origin': 'LHR', 'destination': 'JFK',
+     'departure_datetime': '2025-11-14 10:30',
+     'arrival_datetime': '2025-11-14 13:05', 'price': 100.0},
+    {'flight_id': 'BA2', 'origin': 'LHR', 'destination': 'JFK',
+     'departure_datetime': '2025-11-14 10:30',
+     'arrival_datetime': '2025-11-14 13:05', 'price': float('nan')},
+    {'flight_id': 'BA3', 'origin': 'LHR', 'destination': 'JFK',
+     'departure_datetime': '2025-11-14 10:30',
+     'arrival_datetime': '2025-11-14 13:05', 'price': float('inf')},
+]
+
+
+def _table(flights):
+    table = FlightTable()
+    for flight in flights:
+        table.append(flight)
+    return table
+
+
+def _save_all(tmp_path, flights, pretty, wrap=list):
+    """Write flights with save_json and save_json_stream, returning both files' bytes"""
+    whole = tmp_path / 'whole.json'
+    stream = tmp_path / 'stream.json'
+    utils.save_json(wrap(flights), str(whole), pretty=pretty)
+    utils.save_json_stream([wrap(flights[:1]), wrap(flights[1:])], str(stream),
+                           pretty=pretty)
+    return whole.read_bytes(), stream.read_bytes()
+
+
+@pytest.mark.parametrize('pretty', [False, True])
+@pytest.mark.parametrize('flights', [FLIGHTS, FLIGHTS[:1]], ids=['non_finite', 'finite'])
+def test_output_independent_of_orjson(tmp_path, monkeypatch, flights, pretty):
+    outputs = {_save_all(tmp_path, flights, pretty)}
+    outputs.add(_save_all(tmp_path, flights, pretty, wrap=_table))
+    monkeypatch.setattr(utils, 'orjson', None)
+    outputs.add(_save_all(tmp_path, flights, pretty))
+    
+    assert len(outputs) == 1
+    whole, stream = outputs.pop()
+    assert whole == stream
+
+
+def test_non_finite_prices_round_trip(tmp_path):
+    path = tmp_path / 'db.json'
+    utils.save_json(FLIGHTS, str(path))
+    
+    assert b'NaN' in path.read_bytes()
+    loaded = utils.load_json(str(path))
+    assert math.isnan(loaded[1]['price'])
+    assert loaded[2]['price'] == float('inf')
@@ -4,27 +4,257 @@ Helper functions for saving JSON and error files
 """
 
 import json
+import math
+import os
+import queue
+import threading
 
+from flight_table import FlightTable
 
-def save_json(data, filepath):
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the json module
+    orjson = None
+
+
+def load_json(filepath):
+    """
+    Load data from a JSON file
+    
+    Args:
+        filepath (str): Path to the JSON file
+        
+    Returns:
+        list or dict: Parsed JSON data
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens json writes for
+            # non-finite floats; let json decide whether the file is valid
+            return json.loads(data)
+    
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _has_non_finite(data):
     """
-    Save data to JSON file with proper formatting
+    Check whether data holds a NaN or infinite float anywhere
     
     Args:
-        data (list or dict): Data to save as JSON
+        data: JSON-serializable data
+        
+    Returns:
+        bool: True if any float in data is not finite
+    """
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(map(_has_non_finite, data.values()))
+    if isinstance(data, (list, tuple)):
+        return any(map(_has_non_finite, data))
+    return False
+
+
+def _orjson_option(pretty):
+    """Option flags for orjson.dumps: indented by 2 when pretty, else compact"""
+    option = orjson.OPT_NON_STR_KEYS
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    return option
+
+
+def _orjson_dumps(data, pretty):
+    """
+    Serialize data with orjson where that matches the json module's output
+    
+    orjson writes NaN and infinite floats as null where json writes
+    NaN/Infinity, so data holding them is left to json. Only output that
+    contains null needs the full check.
+    
+    Args:
+        data: JSON-serializable data
+        pretty (bool): Indent by 2 when True, else compact
+        
+    Returns:
+        bytes or None: Serialized data, or None if json must be used
+    """
+    if orjson is None:
+        return None
+    text = orjson.dumps(data, option=_orjson_option(pretty))
+    if b'null' in text and _has_non_finite(data):
+        return None
+    return text
+
+
+def _json_kwargs(pretty):
+    """Keyword arguments for json.dump(s): indented by 2 when pretty, else compact"""
+    if pretty:
+        return {'indent': 2, 'ensure_ascii': False}
+    return {'separators': (',', ':'), 'ensure_ascii': False}
+
+
+def save_json(data, filepath, pretty=False):
+    """
+    Save data to JSON file
+    
+    Args:
+        data (list, dict or FlightTable): Data to save as JSON
         filepath (str): Path where JSON file should be saved
+        pretty (bool): Indent the output for human readers; machine-read
+            files such as db.json are written compactly by default
         
     Raises:
         Exception: If file writing fails
     """
+    # Flight tables are rebuilt as dicts only now, at write time
+    if isinstance(data, FlightTable):
+        data = data.to_dicts()
+    
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        text = _orjson_dumps(data, pretty)
+        if text is not None:
+            with open(filepath, 'wb') as f:
+                f.write(text)
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, **_json_kwargs(pretty))
         print(f"✓ Valid flights saved to: {filepath}")
     except Exception as e:
         raise Exception(f"Error saving JSON: {e}")
 
 
+def _dump_item(item, pretty):
+    """
+    Serialize one array element the way save_json lays it out
+    
+    Args:
+        item: JSON-serializable element
+        pretty (bool): Indent as an element of a pretty-printed array
+        
+    Returns:
+        str: The serialized element
+    """
+    text = _orjson_dumps(item, pretty)
+    if text is not None:
+        text = text.decode('utf-8')
+    else:
+        text = json.dumps(item, **_json_kwargs(pretty))
+    if pretty:
+        return '  ' + text.replace('\n', '\n  ')
+    return text
+
+
+def save_json_stream(chunks, filepath, pretty=False):
+    """
+    Save a JSON array to file incrementally, one chunk of items at a time
+    
+    Produces the same layout as save_json without holding all items in
+    memory at once. Items go to a temporary file beside filepath, which
+    replaces filepath only once every chunk has been written.
+    
+    Args:
+        chunks (iterable): Iterable of lists (or FlightTables) of
+            JSON-serializable items
+        filepath (str): Path where JSON file should be saved
+        pretty (bool): Indent the output for human readers
+        
+    Raises:
+        Exception: If file writing fails
+    """
+    if pretty:
+        opening, separator, closing = '[\n', ',\n', '\n]'
+    else:
+        opening, separator, closing = '[', ',', ']'
+    
+    # Write next to the target and swap it in only after the last chunk,
+    # so a failure part way never leaves a truncated file behind
+    tmp_path = f"{filepath}.tmp"
+    try:
+        f = open(tmp_path, 'w', encoding='utf-8')
+    except Exception as e:
+        raise Exception(f"Error saving JSON: {e}")
+    
+    try:
+        # Errors raised while producing chunks propagate unchanged
+        with f:
+            first = True
+            for chunk in chunks:
+                try:
+                    for item in chunk:
+                        f.write(opening if first else separator)
+                        f.write(_dump_item(item, pretty))
+                        first = False
+                except Exception as e:
+                    raise Exception(f"Error saving JSON: {e}")
+            try:
+                f.write('[]' if first else closing)
+            except Exception as e:
+                raise Exception(f"Error saving JSON: {e}")
+        
+        try:
+            os.replace(tmp_path, filepath)
+        except Exception as e:
+            raise Exception(f"Error saving JSON: {e}")
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    print(f"✓ Valid flights saved to: {filepath}")
+
+
+def iter_in_background(iterable, maxsize=8):
+    """
+    Run an iterable in a producer thread, handing items over a bounded queue
+    
+    Lets the caller consume (e.g. serialize) earlier items while later
+    ones are still being produced. Exceptions raised by the producer are
+    re-raised in the consumer.
+    
+    Args:
+        iterable (iterable): Source of items
+        maxsize (int): Maximum number of items buffered between threads
+        
+    Yields:
+        Items from iterable, in order
+    """
+    items = queue.Queue(maxsize=maxsize)
+    done = object()
+    failure = []
+    
+    def produce():
+        try:
+            for item in iterable:
+                items.put(item)
+        except BaseException as e:
+            failure.append(e)
+        finally:
+            items.put(done)
+    
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    
+    while True:
+        item = items.get()
+        if item is done:
+            break
+        yield item
+    
+    producer.join()
+    if failure:
+        raise failure[0]
+
+
 def save_errors(errors, filepath):
     """
     Save error records to text file with human-readable format
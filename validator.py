@@ -4,25 +4,156 @@ Handles all validation rules for flight records
 """
 
 import re
-from datetime import datetime
+import sys
+
+from flight_table import FLIGHT_FIELDS
+
+# Fields every flight record must provide with a non-empty value
+_REQUIRED_FIELDS = frozenset(FLIGHT_FIELDS)
+
+# Valid airport codes (3-letter IATA codes)
+# You can expand this list with more airports
+VALID_AIRPORTS = frozenset(map(sys.intern, (
+    'LHR', 'JFK', 'FRA', 'RIX', 'OSL', 'HEL', 'ARN', 'CDG', 'DXB',
+    'DOH', 'SYD', 'AMS', 'LAX', 'BRU', 'ORD', 'ATL', 'DFW', 'DEN',
+    'SFO', 'SEA', 'MIA', 'MCO', 'LAS', 'PHX', 'IAH', 'EWR', 'IST',
+    'CLT', 'MSP', 'DTW', 'PHL', 'LGA', 'BOS', 'SLC', 'BWI', 'TPA',
+    'SAN', 'PDX', 'STL', 'HNL', 'SVO', 'LON'
+)))
+
+
+def pack_airport_code(code):
+    """
+    Pack a 3-character ASCII airport code into a 24-bit integer
+    
+    Args:
+        code (str): Three ASCII characters
+        
+    Returns:
+        int: The character codes packed as 0xAABBCC
+    """
+    return (ord(code[0]) << 16) | (ord(code[1]) << 8) | ord(code[2])
+
+
+# Packed whitelist; every entry is 3 uppercase letters, so membership
+# also checks the code's format
+VALID_AIRPORTS_PACKED = frozenset(map(pack_airport_code, VALID_AIRPORTS))
+
+# Rule violation bits, in the order their messages are reported
+ERR_FLIGHT_ID = 1
+ERR_ORIGIN = 2
+ERR_DESTINATION = 4
+ERR_DEPARTURE = 8
+ERR_ARRIVAL = 16
+ERR_ARRIVAL_BEFORE_DEPARTURE = 32
+ERR_PRICE_NEGATIVE = 64
+ERR_PRICE_FORMAT = 128
+
+_ERROR_MESSAGES = (
+    (ERR_FLIGHT_ID, "invalid flight_id (must be 2-8 alphanumeric characters)"),
+    (ERR_ORIGIN, "invalid origin code"),
+    (ERR_DESTINATION, "invalid destination code"),
+    (ERR_DEPARTURE, "invalid departure datetime"),
+    (ERR_ARRIVAL, "invalid arrival datetime"),
+    (ERR_ARRIVAL_BEFORE_DEPARTURE, "arrival before departure"),
+    (ERR_PRICE_NEGATIVE, "negative price value"),
+    (ERR_PRICE_FORMAT, "invalid price format"),
+)
+
+
+def describe_errors(code):
+    """
+    Render a rule violation bitmask as error messages
+    
+    Args:
+        code (int): Bitwise OR of ERR_* flags
+        
+    Returns:
+        list: Error messages for the set bits, in reporting order
+    """
+    return [message for bit, message in _ERROR_MESSAGES if code & bit]
+
+
+# Days in each month of a non-leap year (index 0 unused)
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _datetime_key(year, month, day, hour, minute):
+    """
+    Build a sortable integer key from datetime component strings
+    
+    Args:
+        year, month, day, hour, minute (str): Numeric component strings
+        
+    Returns:
+        int or None: YYYYMMDDHHMM as an integer, or None if out of range
+    """
+    if len(year) != 4 or not 1 <= len(month) <= 2 or not 1 <= len(day) <= 2 \
+            or not 1 <= len(hour) <= 2 or not 1 <= len(minute) <= 2:
+        return None
+    digits = year + month + day + hour + minute
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    
+    y, mo, d, h, mi = int(year), int(month), int(day), int(hour), int(minute)
+    if y < 1 or not 1 <= mo <= 12 or h > 23 or mi > 59 or d < 1:
+        return None
+    
+    max_day = _DAYS_IN_MONTH[mo]
+    if mo == 2 and y % 4 == 0 and (y % 100 != 0 or y % 400 == 0):
+        max_day = 29
+    if d > max_day:
+        return None
+    
+    return (((y * 100 + mo) * 100 + d) * 100 + h) * 100 + mi
+
+
+def parse_mdy_datetime(value):
+    """
+    Parse a '%m/%d/%Y %H:%M' datetime string without strptime
+    
+    Args:
+        value (str): Datetime string such as '11/14/2025 9:30'
+        
+    Returns:
+        int or None: YYYYMMDDHHMM as an integer, or None if invalid
+    """
+    try:
+        date_part, time_part = value.split()
+        month, day, year = date_part.split('/')
+        hour, minute = time_part.split(':')
+    except (ValueError, AttributeError):
+        return None
+    return _datetime_key(year, month, day, hour, minute)
+
+
+def parse_ymd_datetime(value):
+    """
+    Parse a '%Y-%m-%d %H:%M' datetime string without strptime
+    
+    Args:
+        value (str): Datetime string such as '2025-11-14 09:30'
+        
+    Returns:
+        int or None: YYYYMMDDHHMM as an integer, or None if invalid
+    """
+    try:
+        date_part, time_part = value.split()
+        year, month, day = date_part.split('-')
+        hour, minute = time_part.split(':')
+    except (ValueError, AttributeError):
+        return None
+    return _datetime_key(year, month, day, hour, minute)
 
  #ENCAPSULATION
 class FlightValidator:
     """Validates flight data according to specification"""
     
-    # Valid airport codes (3-letter IATA codes)
-    # You can expand this list with more airports
-    VALID_AIRPORTS = {
-        'LHR', 'JFK', 'FRA', 'RIX', 'OSL', 'HEL', 'ARN', 'CDG', 'DXB',
-        'DOH', 'SYD', 'AMS', 'LAX', 'BRU', 'ORD', 'ATL', 'DFW', 'DEN',
-        'SFO', 'SEA', 'MIA', 'MCO', 'LAS', 'PHX', 'IAH', 'EWR', 'IST',
-        'CLT', 'MSP', 'DTW', 'PHL', 'LGA', 'BOS', 'SLC', 'BWI', 'TPA',
-        'SAN', 'PDX', 'STL', 'HNL', 'SVO', 'LON'
-    }
+    # Valid airport codes (see module-level VALID_AIRPORTS)
+    VALID_AIRPORTS = VALID_AIRPORTS
     
-    def __init__(self):
-        """Initialize validator with datetime format"""
-        self.datetime_format = '%m/%d/%Y %H:%M'
+    # Precompiled format check for flight IDs
+    _FID_RE = re.compile(r'\A[A-Za-z0-9]{2,8}\Z')
     
     def validate_flight(self, flight_data):
         """
@@ -36,63 +167,89 @@ class FlightValidator:
                 - is_valid (bool): True if all validations pass
                 - error_messages (list): List of validation error messages
         """
-        errors = []
-        
-        # Check for required fields
-        required_fields = ['flight_id', 'origin', 'destination', 
-                          'departure_datetime', 'arrival_datetime', 'price']
+        # Check for required fields with one set difference; messages keep
+        # the FLIGHT_FIELDS order so error output is unchanged
+        present = {field for field, value in flight_data.items() if value != ''}
+        missing = _REQUIRED_FIELDS - present
+        if missing:
+            return False, [f"missing {field} field"
+                           for field in FLIGHT_FIELDS if field in missing]
         
-        for field in required_fields:
-            if field not in flight_data or flight_data[field] == '':
-                errors.append(f"missing {field} field")
-        
-        # If fields are missing, return early
-        if errors:
-            return False, errors
+        code = 0
         
         # Validate flight_id (2-8 alphanumeric characters)
         if not self._validate_flight_id(flight_data['flight_id']):
-            errors.append(f"invalid flight_id (must be 2-8 alphanumeric characters)")
+            code |= ERR_FLIGHT_ID
         
         # Validate origin (3 uppercase letters, valid airport code)
         if not self._validate_airport_code(flight_data['origin']):
-            errors.append(f"invalid origin code")
+            code |= ERR_ORIGIN
         
         # Validate destination (3 uppercase letters, valid airport code)
         if not self._validate_airport_code(flight_data['destination']):
-            errors.append(f"invalid destination code")
-        
-        # Validate datetimes and compare them
-        departure_dt = None
-        arrival_dt = None
+            code |= ERR_DESTINATION
         
-        try:
-            departure_dt = datetime.strptime(flight_data['departure_datetime'], 
-                                            self.datetime_format)
-        except (ValueError, TypeError):
-            errors.append("invalid departure datetime")
+        # Validate datetimes (%m/%d/%Y %H:%M) and compare them
+        departure_key = parse_mdy_datetime(flight_data['departure_datetime'])
+        if departure_key is None:
+            code |= ERR_DEPARTURE
         
-        try:
-            arrival_dt = datetime.strptime(flight_data['arrival_datetime'], 
-                                          self.datetime_format)
-        except (ValueError, TypeError):
-            errors.append("invalid arrival datetime")
+        arrival_key = parse_mdy_datetime(flight_data['arrival_datetime'])
+        if arrival_key is None:
+            code |= ERR_ARRIVAL
         
         # Check that arrival is after departure
-        if departure_dt and arrival_dt:
-            if arrival_dt <= departure_dt:
-                errors.append("arrival before departure")
+        if departure_key is not None and arrival_key is not None:
+            if arrival_key <= departure_key:
+                code |= ERR_ARRIVAL_BEFORE_DEPARTURE
         
         # Validate price (positive float)
         try:
             price = float(flight_data['price'])
             if price <= 0:
-                errors.append("negative price value")
+                code |= ERR_PRICE_NEGATIVE
         except (ValueError, TypeError):
-            errors.append("invalid price format")
+            code |= ERR_PRICE_FORMAT
         
         # Return validation result
-        return len(errors) == 0, errors
+        return code == 0, describe_errors(code)
+    
+    def validate_batch(self, fid_ok, org_packed, dst_packed, dep_ts, arr_ts,
+                       price, price_ok):
+        """
+        Validate whole columns of already-parsed flight fields at once
+        
+        Uses NumPy array operations; decode a row's result with
+        describe_errors.
+        
+        Args:
+            fid_ok (ndarray): bool, flight_id passed the format check
+            org_packed, dst_packed (ndarray): int64 pack_airport_code
+                values, -1 where the code is not 3 ASCII characters
+            dep_ts, arr_ts (ndarray): int64 datetime keys, -1 if invalid
+            price (ndarray): float64 prices
+            price_ok (ndarray): bool, price parsed as a number
+            
+        Returns:
+            ndarray: uint8 ERR_* bitmask per row (0 means valid)
+        """
+        # Only batch validation needs NumPy, so it is imported on first use
+        import numpy as np
+        
+        airports = np.array(sorted(VALID_AIRPORTS_PACKED), dtype=np.int64)
+        
+        dep_ok = dep_ts >= 0
+        arr_ok = arr_ts >= 0
+        out = np.zeros(len(fid_ok), dtype=np.uint8)
+        out[~fid_ok] |= ERR_FLIGHT_ID
+        out[~np.isin(org_packed, airports)] |= ERR_ORIGIN
+        out[~np.isin(dst_packed, airports)] |= ERR_DESTINATION
+        out[~dep_ok] |= ERR_DEPARTURE
+        out[~arr_ok] |= ERR_ARRIVAL
+        out[dep_ok & arr_ok & (arr_ts <= dep_ts)] |= ERR_ARRIVAL_BEFORE_DEPARTURE
+        out[~price_ok] |= ERR_PRICE_FORMAT
+        out[price_ok & (price <= 0)] |= ERR_PRICE_NEGATIVE
+        return out
     
     def _validate_flight_id(self, flight_id):
         """
@@ -106,9 +263,7 @@ class FlightValidator:
         """
         if not flight_id:
             return False
-        if len(flight_id) < 2 or len(flight_id) > 8:
-            return False
-        return flight_id.isalnum()
+        return self._FID_RE.match(flight_id) is not None
     
     def _validate_airport_code(self, code):
         """
@@ -120,16 +275,13 @@ class FlightValidator:
         Returns:
             bool: True if valid, False otherwise
         """
-        if not code:
-            return False
-        if len(code) != 3:
-            return False
-        if not code.isupper() or not code.isalpha():
+        # Non-ASCII characters would spill across the packed bytes
+        if not code or len(code) != 3 or not code.isascii():
             return False
         
-        # Check against known airport codes
-        # Comment out the next line if you want to accept any 3-letter code
-        return code in self.VALID_AIRPORTS
+        # Check against known airport codes (the packed whitelist only
+        # holds uppercase letters, so this also checks the format)
+        return pack_airport_code(code) in VALID_AIRPORTS_PACKED
     
     def convert_to_typed_flight(self, flight_data):
         """